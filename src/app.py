@@ -1,8 +1,8 @@
+import multiprocessing
 import os
 import sys
-from zipfile import ZipFile
 
-from PyQt6.QtCore import QSize
+from PyQt6.QtCore import QObject, QSize, Qt, QThread, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import (QApplication, QCheckBox, QFileDialog, QHBoxLayout,
                              QLabel, QLineEdit, QMessageBox, QProgressDialog,
@@ -12,6 +12,49 @@ from PyQt6.QtWidgets import (QApplication, QCheckBox, QFileDialog, QHBoxLayout,
 from splitter import PDFSplitter
 
 
+class SplitterWorker(QObject):
+    """Worker that runs the PDF splitting process outside the GUI thread.
+
+    Calls the splitter from a QThread and relays its progress through a Qt
+    signal, so the progress dialog is updated from the main thread and the
+    event loop keeps running during long splits.
+
+    Arguments:
+            QObject: The base class for the SplitterWorker, allowing it to be
+                     moved to a QThread and to emit Qt signals.
+
+    Attributes:
+        splitter (PDFSplitter): Instance of the PDFSplitter class that performs the split.
+        progressChanged (pyqtSignal): Signal emitted with the current progress (0-100).
+        failed (pyqtSignal): Signal emitted with the error message if the splitting process fails.
+        finished (pyqtSignal): Signal emitted when the splitting process ends.
+    """
+
+    progressChanged = pyqtSignal(int)
+    failed = pyqtSignal(str)
+    finished = pyqtSignal()
+
+    def __init__(self, splitter):
+        super().__init__()
+        self.splitter = splitter
+
+    @pyqtSlot()
+    def run(self):
+        """Split the PDF and emit the finished signal once it is done.
+
+        Errors are reported through the failed signal, as an exception escaping
+        a Qt slot would abort the application.
+        """
+        self.splitter.on_progress = self.progressChanged.emit
+        try:
+            self.splitter.split_pdf()
+        except Exception as error:
+            self.failed.emit(str(error) or type(error).__name__)
+        finally:
+            self.splitter.on_progress = lambda progress: None
+            self.finished.emit()
+
+
 class MainWindow(QWidget):
     """Main application window for the PDf Splitter.
 
@@ -39,7 +82,6 @@ class MainWindow(QWidget):
         self.SystemTray.setVisible(True)
 
         self.splitter = PDFSplitter()
-        self.splitter.progress_signal.connect(self.update_progress)
 
         self.initUI()
 
@@ -102,17 +144,20 @@ class MainWindow(QWidget):
 
         # Checkbox to compress to .zip
         self.compres_zip_checkBox = QCheckBox("Compress PDFs to .zip", self)
+        self.compres_zip_checkBox.setToolTip(
+            "PDFs are already compressed, so they are stored in the .zip as they are."
+        )
         main_layout.addWidget(self.compres_zip_checkBox)
 
         # Buttons to split the pdf
         button_layout = QHBoxLayout()
-        split_button = QPushButton("Split PDF", self)
-        split_button.clicked.connect(self.splitPDF)
-        button_layout.addWidget(split_button)
+        self.split_button = QPushButton("Split PDF", self)
+        self.split_button.clicked.connect(self.splitPDF)
+        button_layout.addWidget(self.split_button)
 
-        clear_button = QPushButton("Clear fields", self)
-        clear_button.clicked.connect(self.clearFields)
-        button_layout.addWidget(clear_button)
+        self.clear_button = QPushButton("Clear fields", self)
+        self.clear_button.clicked.connect(self.clearFields)
+        button_layout.addWidget(self.clear_button)
 
         main_layout.addLayout(button_layout)
 
@@ -172,22 +217,38 @@ class MainWindow(QWidget):
         The output will be optionally compressed into a ZIP file based on user selection.
         """
 
-        # Check if the selected file is a PDF (if not, return and send error message)
-        if not self.splitter.check_pdf(self.splitter.input_pdf_path):
-            button = QMessageBox.critical(
-                self,
-                "Error!",
-                "The selected file is not a pdf.",
-                buttons=QMessageBox.StandardButton.Ok,
-                defaultButton=QMessageBox.StandardButton.Ok,
-            )
-            return
+        # Check if the selected file is a PDF (if not, return and send error message).
+        # Missing files are reported below.
+        if os.path.isfile(self.splitter.input_pdf_path):
+            try:
+                is_pdf = self.splitter.check_pdf(self.splitter.input_pdf_path)
+            except PermissionError as error:
+                button = QMessageBox.critical(
+                    self,
+                    "Error!",
+                    str(error),
+                    buttons=QMessageBox.StandardButton.Ok,
+                    defaultButton=QMessageBox.StandardButton.Ok,
+                )
+                return
+
+            if not is_pdf:
+                button = QMessageBox.critical(
+                    self,
+                    "Error!",
+                    "The selected file is not a pdf.",
+                    buttons=QMessageBox.StandardButton.Ok,
+                    defaultButton=QMessageBox.StandardButton.Ok,
+                )
+                return
 
         # If the pdf and directory exist process and split
         if os.path.isfile(self.splitter.input_pdf_path) and os.path.isdir(
             self.splitter.output_directory_path
         ):
             self.splitter.compress_zip = self.compres_zip_checkBox.isChecked()
+            self.splitter.cancel = False
+            self.split_error = None
 
             self.progress_bar = QProgressDialog(
                 "Splitting PDF...", "Cancel", 0, 100, self
@@ -195,19 +256,30 @@ class MainWindow(QWidget):
             self.progress_bar.setModal(True)
             self.progress_bar.setValue(1)
             self.progress_bar.setWindowTitle("PDF Splitter")
+            self.progress_bar.canceled.connect(self.splitter.cancel_progress)
             self.progress_bar.show()
-            self.splitter.split_pdf()
 
-            if self.compres_zip_checkBox.isChecked():
-                self.zip_pdf()
+            # A canceled split keeps running until the PDFs in progress are
+            # written, so no new split can start or clear the fields until then
+            self.split_button.setEnabled(False)
+            self.clear_button.setEnabled(False)
 
-            button = QMessageBox.information(
-                self,
-                "PDF Splitter",
-                "Pdfs have been split successfully!",
-                buttons=QMessageBox.StandardButton.Ok,
-                defaultButton=QMessageBox.StandardButton.Ok,
+            # Run the split in a worker thread to keep the event loop responsive
+            self.split_thread = QThread(self)
+            self.split_worker = SplitterWorker(self.splitter)
+            self.split_worker.moveToThread(self.split_thread)
+
+            self.split_thread.started.connect(self.split_worker.run)
+            self.split_worker.progressChanged.connect(
+                self.update_progress, Qt.ConnectionType.QueuedConnection
             )
+            self.split_worker.failed.connect(self.splitFailed)
+            self.split_worker.finished.connect(self.split_thread.quit)
+            self.split_worker.finished.connect(self.split_worker.deleteLater)
+            self.split_thread.finished.connect(self.split_thread.deleteLater)
+            self.split_thread.finished.connect(self.splitFinished)
+
+            self.split_thread.start()
 
         # If there is no
         elif not self.script_input.text():
@@ -251,6 +323,49 @@ class MainWindow(QWidget):
                 defaultButton=QMessageBox.StandardButton.Ok,
             )
 
+    def splitFinished(self):
+        """Finish the PDF splitting process.
+
+        Called when the worker thread ends. It closes the progress bar, enables
+        the buttons again and notifies the user of the result.
+        """
+        canceled = self.splitter.cancel
+        self.progress_bar.close()
+        self.split_button.setEnabled(True)
+        self.clear_button.setEnabled(True)
+
+        if self.split_error is not None:
+            button = QMessageBox.critical(
+                self,
+                "Error!",
+                f"The PDF could not be split.\n\n{self.split_error}",
+                buttons=QMessageBox.StandardButton.Ok,
+                defaultButton=QMessageBox.StandardButton.Ok,
+            )
+            return
+
+        if canceled:
+            return
+
+        button = QMessageBox.information(
+            self,
+            "PDF Splitter",
+            "Pdfs have been split successfully!",
+            buttons=QMessageBox.StandardButton.Ok,
+            defaultButton=QMessageBox.StandardButton.Ok,
+        )
+
+    def splitFailed(self, message):
+        """Save the error of a failed splitting process.
+
+        Called on the main thread when the worker emits its failed signal, before
+        the worker thread ends. The error is shown by splitFinished.
+
+        Args:
+            message (str): Description of the error.
+        """
+        self.split_error = message
+
     def clearFields(self):
         """Clear all input fields and reset settings.
 
@@ -264,65 +379,17 @@ class MainWindow(QWidget):
 
         self.splitter.defaultAttributes()
 
-    def update_progress(self, sender, **kwargs):
+    def update_progress(self, progress):
         """Update the progress bar of the splitting process.
 
-        When the progress signal is emitted. It updates the
+        When the worker emits its progressChanged signal. It updates the
         progress bar's value based on the current progress.
 
         Args:
-            sender: The object emitting the signal.
-            kwargs: Additional arguments, including 'progress' indicating the progress.
+            progress (int): Current progress of the splitting process (0-100).
         """
-        progress = kwargs.get("progress", 0)
-        self.progress_bar.setWindowTitle("PDF Splitter")
-        self.progress_bar.setValue(progress)
-
-        if self.progress_bar.wasCanceled():
-            self.splitter.cancel_signal.send()
-
-    def zip_pdf(self):
-        """Compress the split PDFs into a ZIP file.
-
-        Creates a ZIP file containing the split PDFs from the output
-        directory, updating the progress bar during the compression process.
-        """
-        progress_dialog = QProgressDialog(
-            "Compresing files into .zip...",
-            "Cancel",
-            1,
-            self.splitter.sub_pdf_num,
-            self,
-        )
-        progress_dialog.setModal(True)
-        progress_dialog.setValue(1)
-        progress_dialog.setWindowTitle("PDF Splitter")
-        progress_dialog.show()
-
-        progress_int = 0
-
-        parent_directory = os.path.dirname(self.splitter.output_directory_path)
-        print(parent_directory)
-        file_name_no_extension = os.path.basename(self.splitter.input_pdf_path).split(
-            "."
-        )[0]
-
-        with ZipFile(
-            f"{parent_directory}/{os.path.basename(file_name_no_extension)}.zip", "w"
-        ) as zip:
-            for root, directories, files in os.walk(
-                self.splitter.output_directory_path
-            ):
-                for file_name in files:
-                    progress_dialog.setValue(progress_int)
-                    file_path = os.path.join(root, file_name)
-                    zip.write(file_path, arcname=file_name)
-                    progress_int += 1
-
-                    if progress_dialog.wasCanceled():
-                        break
-
-        progress_dialog.close()
+        if progress != self.progress_bar.value():
+            self.progress_bar.setValue(progress)
 
     def resource_path(self, relative_path):
         """Obtiene la ruta absoluta a un recurso."""
@@ -335,6 +402,7 @@ class MainWindow(QWidget):
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app = QApplication([])
     window = MainWindow()
     window.show()
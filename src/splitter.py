@@ -1,6 +1,174 @@
-import PyPDF2
-import PyPDF2.errors
-from blinker import Signal
+import io
+import itertools
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from zipfile import ZIP_STORED, ZipFile
+
+import pikepdf
+
+# Minimum time between two progress reports, in seconds
+PROGRESS_INTERVAL = 0.05
+
+# Size of the write buffer of the new PDFs and the ZIP file (1 MiB)
+BUFFER_SIZE = 1 << 20
+
+# Input PDF opened once by each worker process of the split pool
+_input_pdf = None
+
+# Pages of the input PDF, listed once so slices don't walk the page tree
+_input_pages = []
+
+# Number of slices written with an output PDF before it is replaced. Pages
+# removed from it keep their copied objects, so it grows with every slice.
+OUTPUT_PDF_SLICES = 32
+
+# Output PDF reused by each worker process for the slices it writes
+_output_pdf = None
+
+# Number of slices written with the current output PDF
+_output_pdf_slices = 0
+
+
+def _open_input_pdf(input_path):
+    """Opens the input PDF in a worker process.
+
+    Used as the initializer of the split pool, so each worker process parses
+    the input PDF, memory-mapped, and lists its pages once, reusing them for
+    every slice it writes. It also creates the output PDF that the worker
+    reuses for up to OUTPUT_PDF_SLICES slices.
+
+    Args:
+        input_path (str): Path to the PDF file to be split.
+    """
+    global _input_pdf, _input_pages, _output_pdf
+    _input_pdf = pikepdf.open(input_path, access_mode=pikepdf.AccessMode.mmap)
+    _input_pages = list(_input_pdf.pages)
+    _output_pdf = pikepdf.Pdf.new()
+
+
+def _preallocate(output_file, size):
+    """Reserves disk space for a file before writing it.
+
+    Lets the file system allocate the file in one go instead of extending
+    it on every write. Preallocation is only a hint, so it is skipped on
+    platforms or file systems that do not support it.
+
+    Args:
+        output_file (file): File opened for writing.
+        size (int): Expected size of the file in bytes.
+    """
+    if size <= 0:
+        return
+
+    try:
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(output_file.fileno(), 0, size)
+        elif sys.platform == "win32":
+            # Extending the file on Windows sets its end with SetEndOfFile
+            output_file.truncate(size)
+    except OSError:
+        pass
+
+
+def _save_slice(start, count, output_file):
+    """Saves a slice of the input PDF into a file-like object.
+
+    Runs in a worker process, using the input and output PDFs created by
+    _open_input_pdf instead of receiving them from the parent process.
+
+    Args:
+        start (int): Index of the first page of the slice.
+        count (int): Number of pages of the slice.
+        output_file (file): File-like object where the new PDF will be saved.
+    """
+    global _output_pdf, _output_pdf_slices
+
+    # Add the pages to the new PDF
+    _output_pdf.pages.extend(_input_pages[start : start + count])
+
+    # Save the new pdf and empty it for the next slice
+    try:
+        _output_pdf.save(output_file, linearize=False)
+    finally:
+        del _output_pdf.pages[:]
+
+        # Replace the output PDF to free the objects copied into it
+        _output_pdf_slices += 1
+        if _output_pdf_slices >= OUTPUT_PDF_SLICES:
+            _output_pdf.close()
+            _output_pdf = pikepdf.Pdf.new()
+            _output_pdf_slices = 0
+
+
+def _write_slice(start, count, output_pdf_path, size_hint):
+    """Writes a slice of the input PDF into a new PDF file.
+
+    Args:
+        start (int): Index of the first page of the slice.
+        count (int): Number of pages of the slice.
+        output_pdf_path (str): Path where the new PDF will be saved.
+        size_hint (int): Estimated size of the new PDF in bytes.
+    """
+    with open(output_pdf_path, "wb", buffering=BUFFER_SIZE) as output_file:
+        _preallocate(output_file, size_hint)
+        _save_slice(start, count, output_file)
+
+        # Drop the space reserved beyond the end of the new pdf
+        output_file.truncate()
+
+
+def _render_slice(start, count):
+    """Renders a slice of the input PDF into memory.
+
+    Used when the new PDFs go straight into a ZIP file, so they are sent back
+    to the parent process instead of being written to the output directory.
+
+    Args:
+        start (int): Index of the first page of the slice.
+        count (int): Number of pages of the slice.
+
+    Returns:
+        bytes: Content of the new PDF.
+    """
+    output_file = io.BytesIO()
+    _save_slice(start, count, output_file)
+    return output_file.getvalue()
+
+
+def _store_pdfs(zip_path, pdf_queue, errors):
+    """Stores the PDFs received through a queue into a ZIP file.
+
+    Runs in its own thread, so the ZIP file is written while the split pool
+    keeps creating PDFs. Stops when it receives None. PDFs are already
+    compressed, deflating them again only wastes CPU time.
+
+    Args:
+        zip_path (Path): Path where the ZIP file will be saved.
+        pdf_queue (Queue): Queue of (name, content) tuples of the PDFs to store.
+        errors (list): List where the error that stopped the thread is saved.
+    """
+    received_all = False
+    try:
+        with open(zip_path, "wb", buffering=BUFFER_SIZE) as zip_file, ZipFile(
+            zip_file, "w", compression=ZIP_STORED, allowZip64=True
+        ) as output_zip:
+            while (pdf := pdf_queue.get()) is not None:
+                output_zip.writestr(*pdf)
+            received_all = True
+    except Exception as error:
+        errors.append(error)
+
+        # Keep emptying the queue so the split thread is never blocked. Closing
+        # the ZIP file may fail after None was received, as the buffered data is
+        # only written then.
+        while not received_all and pdf_queue.get() is not None:
+            pass
 
 
 class PDFSplitter:
@@ -17,15 +185,12 @@ class PDFSplitter:
         compress_zip (bool): Flag indicating whether to compress the output PDFs into a ZIP file.
         sub_pdf_num (int): Counter for the number of split PDFs generated.
         cancel (bool): Flag to indicate if the splitting process should be canceled.
-        progress_signal (Signal): Signal emitted to indicate progress during the splitting process.
-        cancel_signal (Signal): Signal emitted to request cancellation of the splitting process.
+        on_progress (callable): Callback called with the progress (0-100) of the splitting process.
     """
 
     def __init__(self):
         self.defaultAttributes()
-        self.progress_signal = Signal()
-        self.cancel_signal = Signal()
-        self.cancel_signal.connect(self.cancel_progress)
+        self.on_progress = lambda progress: None
 
     def defaultAttributes(self):
         """Resets the attributes to their default values.
@@ -41,60 +206,190 @@ class PDFSplitter:
         self.cancel = False
 
     def check_pdf(self, pdf):
+        """Checks whether a file is a PDF.
+
+        Looks for the %PDF- header and the %%EOF marker instead of parsing the
+        whole file. Only files with the header later in the first KiB or without
+        the marker near the end are parsed to decide.
+
+        Args:
+            pdf (str): Path to the file to be checked.
+
+        Returns:
+            bool: True if the file is a PDF, False otherwise.
+
+        Raises:
+            PermissionError: If the PDF file is password-protected.
+        """
         try:
-            read_pdf = PyPDF2.PdfReader(pdf)
+            with open(pdf, "rb") as file:
+                head = file.read(1024)
+                file.seek(max(os.fstat(file.fileno()).st_size - 1024, 0))
+                tail = file.read()
+        except OSError:
+            return False
+
+        if head.startswith(b"%PDF-") and b"%%EOF" in tail:
             return True
-        except PyPDF2.errors.PdfReadError:
+
+        if b"%PDF-" not in head:
+            return False
+
+        try:
+            with self.read_pdf(pdf):
+                return True
+        except pikepdf.PdfError:
             return False
 
     def read_pdf(self, pdf):
-        """Reads a PDF file and returns a PdfReader object.
+        """Reads a PDF file and returns a Pdf object.
+
+        The file is memory-mapped, so the many seeks through its xref and object
+        streams are served from the page cache instead of read() calls.
 
         Args:
             pdf (str): Path to the PDF file to be read.
 
         Returns:
-            PdfReader: A PdfReader object representing the PDF file.
+            Pdf: A pikepdf Pdf object representing the PDF file.
+
+        Raises:
+            PermissionError: If the PDF file is password-protected.
         """
-        return PyPDF2.PdfReader(pdf)
+        try:
+            return pikepdf.open(pdf, access_mode=pikepdf.AccessMode.mmap)
+        except pikepdf.PasswordError as error:
+            raise PermissionError("The selected PDF is password-protected.") from error
 
     def split_pdf(self):
         """Splits the input PDF into smaller PDFs based on the specified number of pages.
 
         Reads the input PDF, creates new PDFs with the specified number of pages,
-        and saves them to the output directory. Progress is reported via the progress_signal.
-        If cancellation is requested, the process will stop.
+        and saves them to the output directory, or into a ZIP file in it when
+        compress_zip is set. The new PDFs are created in parallel
+        by a pool of worker processes. Progress is reported via on_progress.
+        If cancellation is requested, the pending PDFs will not be written and an
+        unfinished ZIP file is removed.
         """
-        # Open the pdf
-        with open(self.input_pdf_path, "rb") as input_file:
-            reader = self.read_pdf(input_file)
-            total_pages = len(reader.pages)
-            self.sub_pdf_num = 1
-
-            for start_page in range(0, total_pages, self.pages_per_pdf):
-                # New PDF Document
-                writer = PyPDF2.PdfWriter()
-
-                # Add the pages to the new PDF
-                for page_num in range(
-                    start_page, min(start_page + self.pages_per_pdf, total_pages)
+        # Open the pdf. check_pdf only looks at the markers of the file, so a
+        # damaged file may still pass it and fail here.
+        try:
+            with self.read_pdf(self.input_pdf_path) as input_pdf:
+                total_pages = len(input_pdf.pages)
+        except pikepdf.PdfError as error:
+            raise ValueError("The selected file is not a pdf.") from error
+
+        # Estimate the size of each new PDF from the size of its pages
+        input_size = os.path.getsize(self.input_pdf_path)
+        size_hint = input_size * self.pages_per_pdf // max(total_pages, 1)
+
+        # One (name, function, arguments) task per new PDF. When compressing,
+        # the PDFs are rendered into memory to be stored in the .zip.
+        tasks = []
+        for start_page in range(0, total_pages, self.pages_per_pdf):
+            pdf_name = f"{len(tasks) + 1}.pdf"
+            if self.compress_zip:
+                tasks.append(
+                    (pdf_name, _render_slice, (start_page, self.pages_per_pdf))
+                )
+            else:
+                output_pdf_path = f"{self.output_directory_path}/{pdf_name}"
+                tasks.append(
+                    (
+                        pdf_name,
+                        _write_slice,
+                        (start_page, self.pages_per_pdf, output_pdf_path, size_hint),
+                    )
+                )
+
+        self.sub_pdf_num = 1
+
+        # When compressing, the new PDFs go straight into the .zip instead of
+        # being written to the output directory and read back. A thread stores
+        # them while the pool keeps splitting. If it fails, the split stops.
+        zip_errors = []
+        if self.compress_zip:
+            zip_path = Path(self.output_directory_path) / (
+                f"{Path(self.input_pdf_path).stem}.zip"
+            )
+            pdf_queue = queue.Queue(maxsize=4)
+            zip_thread = threading.Thread(
+                target=_store_pdfs, args=(zip_path, pdf_queue, zip_errors)
+            )
+            zip_thread.start()
+
+        # Windows does not allow more than 61 workers in a process pool
+        workers_num = min(os.cpu_count() or 1, 61)
+
+        # Write the new PDFs in parallel. Spawn the workers instead of forking
+        # them, as forking a process that runs Qt threads is not safe.
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers_num,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_open_input_pdf,
+                initargs=(self.input_pdf_path,),
+            ) as executor:
+                # Keep at most two PDFs per worker in flight, submitting the next
+                # task as each one completes. Together with the bounded queue,
+                # this limits the number of rendered PDFs waiting in memory.
+                pending_tasks = iter(tasks)
+                futures = {}
+                for pdf_name, function, args in itertools.islice(
+                    pending_tasks, 2 * workers_num
                 ):
-                    writer.add_page(reader.pages[page_num])
+                    futures[executor.submit(function, *args)] = pdf_name
+
+                # The percentage can only change every progress_step PDFs
+                pdfs_num = len(tasks)
+                progress_step = max(1, pdfs_num // 100)
+                last_progress = -1
+                last_time = time.monotonic()
+
+                while futures and not (self.cancel or zip_errors):
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        # Drop the finished future so its PDF content can be freed
+                        pdf_name = futures.pop(future)
+                        if self.compress_zip:
+                            pdf_queue.put((pdf_name, future.result()))
+                        else:
+                            future.result()
+                        self.sub_pdf_num += 1
+
+                        task = next(pending_tasks, None)
+                        if task is not None and not (self.cancel or zip_errors):
+                            pdf_name, function, args = task
+                            futures[executor.submit(function, *args)] = pdf_name
 
-                # Save the new pdf
-                output_pdf_path = f"{self.output_directory_path}/{self.sub_pdf_num}.pdf"
-                self.sub_pdf_num += 1
+                        # Report whole-percent changes at most every
+                        # PROGRESS_INTERVAL seconds, always reporting the last PDF
+                        pdfs_done = self.sub_pdf_num - 1
+                        if pdfs_done % progress_step == 0 or pdfs_done == pdfs_num:
+                            progress = pdfs_done * 100 // pdfs_num
+                            now = time.monotonic()
+                            if progress != last_progress and (
+                                now - last_time > PROGRESS_INTERVAL or progress == 100
+                            ):
+                                self.on_progress(progress)
+                                last_progress = progress
+                                last_time = now
 
-                with open(output_pdf_path, "wb") as output_file:
-                    writer.write(output_file)
+                if self.cancel or zip_errors:
+                    executor.shutdown(cancel_futures=True)
+        finally:
+            if self.compress_zip:
+                pdf_queue.put(None)
+                zip_thread.join()
 
-                progress = (start_page + self.pages_per_pdf) / total_pages * 100
-                self.progress_signal.send(progress=int(progress))
+                # A canceled or failed .zip misses PDFs, so it is not left behind
+                if self.sub_pdf_num <= len(tasks) or zip_errors:
+                    zip_path.unlink(missing_ok=True)
 
-                if self.cancel:
-                    break
+        if zip_errors:
+            raise zip_errors[0]
 
-    def cancel_progress(self, sender, **kwargs):
+    def cancel_progress(self):
         """Cancels the PDF splitting process.
 
         Sets the cancel flag to True, which will stop the splitting process